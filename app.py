@@ -3,9 +3,13 @@ import dash_core_components as dcc
 import dash_html_components as html
 import dash_bootstrap_components as dbc
 from dash.dependencies import Input, Output
+from flask_caching import Cache
+import numpy as np
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
+import hashlib
+import orjson
+import os
 import warnings
 
 warnings.filterwarnings("ignore")
@@ -14,43 +18,240 @@ warnings.filterwarnings("ignore")
 url = 'https://drive.google.com/file/d/1yQnLfjiEoljn88_EbY0sYTx3SxAKJfUF/view?usp=sharing'
 file_id = url.split('/')[-2]
 download_url = f'https://drive.google.com/uc?export=download&id={file_id}'
-data = pd.read_csv(download_url)
-
-# Data Preprocessing and Calculation (based on your notebook)
-data['Fecha'] = pd.to_datetime(data['Fecha'])
-data['Ingresos'] = data['Unidades Vendidas'] * data['Precio'] # Assuming 'Ingresos' was calculated here based on previous cells
+# Parsed data is cached as Parquet so later starts skip the download and CSV parsing
+cache_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cache.parquet')
+
+if os.path.exists(cache_path):
+    data = pd.read_parquet(cache_path)
+else:
+    # Only read the columns the dashboard uses, with compact dtypes; Producto and
+    # Vendedor are low-cardinality groupby keys, so they are read as categoricals
+    data = pd.read_csv(download_url,
+                       usecols=['Fecha', 'Producto', 'Vendedor', 'Unidades Vendidas', 'Precio'],
+                       dtype={'Unidades Vendidas': np.int32, 'Precio': np.int32,
+                              'Producto': 'category', 'Vendedor': 'category'},
+                       parse_dates=['Fecha'])
+
+    # Data Preprocessing and Calculation (based on your notebook)
+    # Inputs are read narrow, but revenue is computed in 64 bits so row values and sums cannot overflow
+    data['Ingresos'] = np.multiply(data['Unidades Vendidas'].to_numpy(), data['Precio'].to_numpy(), dtype=np.int64) # Assuming 'Ingresos' was calculated here based on previous cells
+
+    # Write to a per-process temp file and rename it into place, so concurrent workers
+    # never read a half-written cache; if the directory is not writable just skip caching
+    tmp_cache_path = f'{cache_path}.{os.getpid()}.tmp'
+    try:
+        data.to_parquet(tmp_cache_path)
+        os.replace(tmp_cache_path, cache_path)
+    except OSError:
+        if os.path.exists(tmp_cache_path):
+            os.remove(tmp_cache_path)
+
+def compact_ingresos(values):
+    # float32 only represents integers exactly up to 2**24, so revenue is downcast
+    # (to a compact C-contiguous array) only while every total stays below that
+    values = np.asarray(values)
+    if values.size and np.abs(values).max() < 2**24:
+        return np.ascontiguousarray(values, dtype=np.float32)
+    return np.ascontiguousarray(values)
 
 # Calculate aggregated data needed for the dashboard
-# Calculate total units sold per product
-product_sales = data.groupby('Producto')['Unidades Vendidas'].sum().reset_index()
-
-# Calculate total revenue per product
-ingresos_por_producto = data.groupby('Producto')['Ingresos'].sum().reset_index()
-ingresos_por_producto['Producto_Corto'] = ingresos_por_producto['Producto'].apply(lambda x: x.split()[0])
+# Calculate total units sold and total revenue per product in a single pass
+prod_agg = data.groupby('Producto', observed=True).agg(**{
+    'Unidades Vendidas': ('Unidades Vendidas', 'sum'),
+    'Ingresos': ('Ingresos', 'sum'),
+}).reset_index()
+prod_agg['Ingresos'] = compact_ingresos(prod_agg['Ingresos'])
+product_sales = prod_agg[['Producto', 'Unidades Vendidas']]
+ingresos_por_producto = prod_agg[['Producto', 'Ingresos']].copy()
+ingresos_por_producto['Producto_Corto'] = ingresos_por_producto['Producto'].str.split(n=1).str[0]
 ingresos_por_producto = ingresos_por_producto.sort_values(by='Ingresos', ascending=False)
 
-# Calculate total revenue per seller
-ingresos_por_vendedor = data.groupby('Vendedor')['Ingresos'].sum().reset_index()
+# Calculate total revenue per seller; the pie, the ranking bar and the seller card all read this one frame
+ingresos_por_vendedor = data.groupby('Vendedor', observed=True)['Ingresos'].sum().reset_index()
+# The mean is taken from the full-width totals, before any downcast
+MEAN_INGRESOS_PER_SELLER = ingresos_por_vendedor['Ingresos'].mean()
+ingresos_por_vendedor['Ingresos'] = compact_ingresos(ingresos_por_vendedor['Ingresos'])
 ingresos_por_vendedor = ingresos_por_vendedor.sort_values(by='Ingresos', ascending=False)
-# Add a 'Rank' column to the seller revenue data for the ranking chart
-ingresos_por_vendedor['Rank'] = ingresos_por_vendedor['Ingresos'].rank(method='dense', ascending=False).astype(int)
+# Add a 'Rank' column to the seller revenue data for the ranking chart (already sorted, so rank = position)
+ingresos_por_vendedor['Rank'] = np.arange(1, len(ingresos_por_vendedor) + 1)
+# Bar labels for the ranking chart
+ingresos_por_vendedor['Text_Label'] = (
+    "#" + ingresos_por_vendedor['Rank'].astype(str) + "<br>$"
+    + ingresos_por_vendedor['Ingresos'].map("{:,.0f}".format).str.replace(',', '.')
+)
+
+# Precompute the per-seller aggregates used by the seller performance card
+SELLER_TOTAL = ingresos_por_vendedor.set_index('Vendedor')['Ingresos'].to_dict()
+# Revenue per product for each seller, already formatted for the card's table;
+# the data is partitioned by seller once instead of masked on every selection
+SELLER_PRODUCT_REV = {}
+for vendedor, data_vendedor in data.groupby('Vendedor', observed=True, sort=False):
+    ingresos_productos_vendedor = data_vendedor.groupby('Producto', observed=True)['Ingresos'].sum().reset_index()
+    ingresos_productos_vendedor = ingresos_productos_vendedor.sort_values(by='Ingresos', ascending=False)
+    ingresos_productos_vendedor['Ingresos_Texto'] = ingresos_productos_vendedor['Ingresos'].map("${:,.0f}".format)
+    SELLER_PRODUCT_REV[vendedor] = ingresos_productos_vendedor
 
 # Calculate daily sales
-daily_sales = data.groupby('Fecha')[['Unidades Vendidas', 'Ingresos']].sum().reset_index()
+codes, fechas = pd.factorize(data['Fecha'], sort=True)
+daily_sales = pd.DataFrame({
+    'Fecha': fechas,
+    'Unidades Vendidas': np.bincount(codes, weights=data['Unidades Vendidas'].to_numpy(), minlength=len(fechas)),
+    'Ingresos': np.bincount(codes, weights=data['Ingresos'].to_numpy(), minlength=len(fechas)),
+})
+# bincount sums in float64; units go back to the source integer dtype
+daily_sales['Unidades Vendidas'] = daily_sales['Unidades Vendidas'].astype(data['Unidades Vendidas'].dtype)
+daily_sales['Ingresos'] = compact_ingresos(daily_sales['Ingresos'])
 
 # Calculate the product indicators
-producto_mas_vendido_unidades = product_sales.loc[product_sales['Unidades Vendidas'].idxmax()]
-producto_menos_vendido_unidades = product_sales.loc[product_sales['Unidades Vendidas'].idxmin()]
-producto_mas_ingresos = ingresos_por_producto.loc[ingresos_por_producto['Ingresos'].idxmax()]
-producto_menos_ingresos = ingresos_por_producto.loc[ingresos_por_producto['Ingresos'].idxmin()]
+unidades_producto = product_sales['Unidades Vendidas'].to_numpy()
+ingresos_producto = ingresos_por_producto['Ingresos'].to_numpy()
+producto_mas_vendido_unidades = product_sales.iloc[unidades_producto.argmax()]
+producto_menos_vendido_unidades = product_sales.iloc[unidades_producto.argmin()]
+producto_mas_ingresos = ingresos_por_producto.iloc[ingresos_producto.argmax()]
+producto_menos_ingresos = ingresos_por_producto.iloc[ingresos_producto.argmin()]
 
 
 # Define the color palette
 colores_contraste = ['#E6A57E', '#B07D62', '#A7BFA7', '#CFC2A4']
 
+def figure_to_json(fig):
+    # Serialize with orjson once and keep the plain dict, so Dash only has to dump
+    # builtin types when it sends the figure
+    return orjson.loads(fig.to_json(engine='orjson'))
+
+# Build the static figures once; the aggregates above never change, so the
+# pre-serialized figure dicts are embedded directly in the layout
+# One trace per product, as plotly express did with color=, so each bar keeps its legend entry
+fig_ingresos_producto = go.Figure([
+    go.Bar(x=[producto], y=[ingresos], name=producto, legendgroup=producto, showlegend=True,
+           marker_color=color,
+           texttemplate='$%{y:,.0f}',
+           textposition='outside',
+           hovertemplate='Producto=%{x}<br>Ingresos=%{y}<extra></extra>')
+    for producto, ingresos, color in zip(ingresos_por_producto['Producto_Corto'].to_numpy(),
+                                         ingresos_por_producto['Ingresos'].to_numpy(),
+                                         np.resize(colores_contraste, len(ingresos_por_producto)).tolist())
+])
+fig_ingresos_producto.update_layout(
+    title='Ingresos por Producto',
+    xaxis_title='Producto',
+    yaxis_title='Ingresos',
+    legend_title_text='Producto',
+    barmode='relative',
+    xaxis_tickangle=-45,
+    template='plotly_white'
+)
+FIG_INGRESOS_PRODUCTO = figure_to_json(fig_ingresos_producto)
+
+fig_vendedor_pie = go.Figure(go.Pie(
+    labels=ingresos_por_vendedor['Vendedor'].to_numpy(),
+    values=ingresos_por_vendedor['Ingresos'].to_numpy(),
+    marker_colors=np.resize(colores_contraste, len(ingresos_por_vendedor)).tolist(),
+    textposition='inside',
+    textinfo='percent+label',
+    hovertemplate="<b>%{label}</b><br>Ingresos: %{value:,.0f}<br>Porcentaje: %{percent}<extra></extra>"
+))
+fig_vendedor_pie.update_layout(
+    title='Distribución de Ingresos por Vendedor',
+    template='plotly_white'
+)
+FIG_VENDEDOR_PIE = figure_to_json(fig_vendedor_pie)
+
+fig_daily = go.Figure()
+fig_daily.add_trace(go.Scatter(x=daily_sales['Fecha'], y=daily_sales['Ingresos'], mode='lines+markers', name='Ingresos Diarios', line=dict(color=colores_contraste[0])))
+fig_daily.add_trace(go.Scatter(x=daily_sales['Fecha'], y=daily_sales['Unidades Vendidas'], mode='lines+markers', name='Unidades Vendidas Diarias', yaxis='y2', line=dict(color=colores_contraste[1])))
+fig_daily.update_layout(
+    title='Ingresos y Unidades Vendidas Diarias',
+    xaxis_title='Fecha',
+    yaxis_title='Ingresos',
+    yaxis2=dict(
+        title='Unidades Vendidas',
+        overlaying='y',
+        side='right'
+    ),
+    template='plotly_white'
+)
+FIG_DAILY = figure_to_json(fig_daily)
+
+# One trace per seller, as plotly express did with color=, so each bar keeps its legend entry
+fig_vendedor_bar = go.Figure([
+    go.Bar(x=[vendedor], y=[ingresos], text=[etiqueta], name=vendedor, legendgroup=vendedor, showlegend=True,
+           marker_color=color,
+           textposition='outside',
+           hovertemplate='Vendedor=%{x}<br>Ingresos=%{y}<br>Text_Label=%{text}<extra></extra>')
+    for vendedor, ingresos, etiqueta, color in zip(ingresos_por_vendedor['Vendedor'].to_numpy(),
+                                                   ingresos_por_vendedor['Ingresos'].to_numpy(),
+                                                   ingresos_por_vendedor['Text_Label'].to_numpy(),
+                                                   np.resize(colores_contraste, len(ingresos_por_vendedor)).tolist())
+])
+fig_vendedor_bar.update_layout(
+    title='Ranking de Ingresos Totales por Vendedor',
+    xaxis_title='Vendedor',
+    yaxis_title='Ingresos',
+    legend_title_text='Vendedor',
+    barmode='relative',
+    xaxis_tickangle=-45,
+    template='plotly_white'
+)
+FIG_VENDEDOR_BAR = figure_to_json(fig_vendedor_bar)
+
+fig_indicators = go.Figure()
+
+fig_indicators.add_trace(go.Indicator(
+    mode="number",
+    value=producto_mas_vendido_unidades['Unidades Vendidas'],
+    title={"text": f"Producto Más Vendido<br><span style='font-size:0.8em;color:gray'>({producto_mas_vendido_unidades['Producto']})</span>"},
+    domain={'x': [0, 0.25], 'y': [0.5, 1]}
+))
+
+fig_indicators.add_trace(go.Indicator(
+    mode="number",
+    value=producto_menos_vendido_unidades['Unidades Vendidas'],
+    title={"text": f"Producto Menos Vendido<br><span style='font-size:0.8em;color:gray'>({producto_menos_vendido_unidades['Producto']})</span>"},
+    domain={'x': [0.35, 0.60], 'y': [0.5, 1]}
+))
+
+fig_indicators.add_trace(go.Indicator(
+    mode="number",
+    value=producto_mas_ingresos['Ingresos'],
+    title={"text": f"Producto con Más Ingresos<br><span style='font-size:0.8em;color:gray'>({producto_mas_ingresos['Producto']})</span>"},
+     number={'prefix': "$", 'valueformat': '.,0f'},
+    domain={'x': [0, 0.25], 'y': [0, 0.45]}
+))
+
+fig_indicators.add_trace(go.Indicator(
+    mode="number",
+    value=producto_menos_ingresos['Ingresos'],
+    title={"text": f"Producto con Menos Ingresos<br><span style='font-size:0.8em;color:gray'>({producto_menos_ingresos['Producto']})</span>"},
+     number={'prefix': "$", 'valueformat': '.,0f'},
+    domain={'x': [0.35, 0.60], 'y': [0, 0.45]}
+))
+
+fig_indicators.update_layout(
+    grid = {'rows': 2, 'columns': 2, 'pattern': "independent"},
+    title="Indicadores Clave de Ventas por Producto"
+)
+FIG_INDICATORS = figure_to_json(fig_indicators)
+
 # Create the Dash app
 app = dash.Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP])
 server = app.server # This is needed for deployment on platforms like Heroku
+# Filesystem cache shared by every worker process, so a seller card built by one
+# worker is reused by the others; the directory can be moved with DASH_CACHE_DIR.
+# Like the Parquet cache, a directory that cannot be created does not stop startup:
+# each worker then just keeps its own in-memory cache
+try:
+    cache = Cache(server, config={
+        'CACHE_TYPE': 'FileSystemCache',
+        'CACHE_DIR': os.environ.get('DASH_CACHE_DIR',
+                                    os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache')),
+    })
+except OSError:
+    cache = Cache(server, config={'CACHE_TYPE': 'SimpleCache'})
+# The cache outlives restarts, so memoized keys include a hash of the loaded data
+# and new data never hits entries built from the old one (FileSystemCache ignores
+# CACHE_KEY_PREFIX, so the hash goes into the memoized function name instead)
+data_version = hashlib.sha1(pd.util.hash_pandas_object(data, index=False).to_numpy().tobytes()).hexdigest()[:16]
 
 # Define the layout of the app
 app.layout = dbc.Container([
@@ -58,32 +259,32 @@ app.layout = dbc.Container([
 
     dbc.Row([
         dbc.Col(
-            dcc.Graph(id='ingresos-por-producto'),
+            dcc.Graph(id='ingresos-por-producto', figure=FIG_INGRESOS_PRODUCTO),
             width=6
         ),
         dbc.Col(
-            dcc.Graph(id='ingresos-por-vendedor-pie'),
+            dcc.Graph(id='ingresos-por-vendedor-pie', figure=FIG_VENDEDOR_PIE),
             width=6
         ),
     ]),
 
     dbc.Row([
         dbc.Col(
-            dcc.Graph(id='daily-sales-line'),
+            dcc.Graph(id='daily-sales-line', figure=FIG_DAILY),
             width=12
         ),
     ]),
 
     dbc.Row([
         dbc.Col(
-            dcc.Graph(id='ingresos-por-vendedor-bar'),
+            dcc.Graph(id='ingresos-por-vendedor-bar', figure=FIG_VENDEDOR_BAR),
             width=12
         )
     ]),
 
     dbc.Row([
         dbc.Col(
-            dcc.Graph(id='product-performance-indicators'),
+            dcc.Graph(id='product-performance-indicators', figure=FIG_INDICATORS),
             width=12
         ),
     ]),
@@ -112,162 +313,17 @@ app.layout = dbc.Container([
 ], fluid=True)
 
 # Define callbacks to update graphs
-@app.callback(
-    Output('ingresos-por-producto', 'figure'),
-    Input('ingresos-por-producto', 'id') # Dummy input
-)
-def update_ingresos_por_producto_graph(_):
-    fig = px.bar(ingresos_por_producto,
-                 x='Producto_Corto',
-                 y='Ingresos',
-                 title='Ingresos por Producto',
-                 labels={'Producto_Corto': 'Producto', 'Ingresos': 'Ingresos'},
-                 template='plotly_white',
-                 color='Producto_Corto',
-                 color_discrete_sequence=colores_contraste)
-    fig.update_layout(xaxis_tickangle=-45)
-    fig.update_traces(texttemplate='$%{y:,.0f}', textposition='outside')
-    return fig
-
-@app.callback(
-    Output('ingresos-por-vendedor-pie', 'figure'),
-    Input('ingresos-por-vendedor-pie', 'id') # Dummy input
-)
-def update_ingresos_por_vendedor_pie(_):
-    fig = px.pie(ingresos_por_vendedor,
-                 values='Ingresos',
-                 names='Vendedor',
-                 title='Distribución de Ingresos por Vendedor',
-                 hover_data=['Ingresos'],
-                 labels={'Ingresos':'Ingresos Totales'},
-                 template='plotly_white',
-                 color_discrete_sequence=colores_contraste)
-    fig.update_traces(textposition='inside', textinfo='percent+label',
-                      hovertemplate="<b>%{label}</b><br>Ingresos: %{value:,.0f}<br>Porcentaje: %{percent}")
-    return fig
-
-@app.callback(
-    Output('daily-sales-line', 'figure'),
-    Input('daily-sales-line', 'id') # Dummy input
-)
-def update_daily_sales_line(_):
-    fig = go.Figure()
-    fig.add_trace(go.Scatter(x=daily_sales['Fecha'], y=daily_sales['Ingresos'], mode='lines+markers', name='Ingresos Diarios', line=dict(color=colores_contraste[0])))
-    fig.add_trace(go.Scatter(x=daily_sales['Fecha'], y=daily_sales['Unidades Vendidas'], mode='lines+markers', name='Unidades Vendidas Diarias', yaxis='y2', line=dict(color=colores_contraste[1])))
-
-    fig.update_layout(
-        title='Ingresos y Unidades Vendidas Diarias',
-        xaxis_title='Fecha',
-        yaxis_title='Ingresos',
-        yaxis2=dict(
-            title='Unidades Vendidas',
-            overlaying='y',
-            side='right'
-        ),
-        template='plotly_white'
-    )
-    return fig
-
-@app.callback(
-    Output('ingresos-por-vendedor-bar', 'figure'),
-    Input('ingresos-por-vendedor-bar', 'id') # Dummy input
-)
-def update_ingresos_por_vendedor_bar(_):
-    ingresos_por_vendedor_ranked = data.groupby('Vendedor')['Ingresos'].sum().reset_index()
-    ingresos_por_vendedor_ranked = ingresos_por_vendedor_ranked.sort_values(by='Ingresos', ascending=False).reset_index(drop=True)
-    ingresos_por_vendedor_ranked['Rank'] = ingresos_por_vendedor_ranked.index + 1
-
-    ingresos_por_vendedor_ranked['Text_Label'] = ingresos_por_vendedor_ranked.apply(
-        lambda row: f"#{row['Rank']}<br>${row['Ingresos']:,.0f}".replace(',', '.'), axis=1
-    )
-
-    fig = px.bar(ingresos_por_vendedor_ranked,
-                 x='Vendedor',
-                 y='Ingresos',
-                 text='Text_Label',
-                 title='Ranking de Ingresos Totales por Vendedor',
-                 labels={'Vendedor': 'Vendedor', 'Ingresos': 'Ingresos'},
-                 template='plotly_white',
-                 color='Vendedor',
-                 color_discrete_sequence=colores_contraste)
-    fig.update_layout(xaxis_tickangle=-45)
-    fig.update_traces(textposition='outside')
-    return fig
-
-@app.callback(
-    Output('product-performance-indicators', 'figure'),
-    Input('product-performance-indicators', 'id') # Dummy input
-)
-def update_product_indicators(_):
-    fig = go.Figure()
-
-    fig.add_trace(go.Indicator(
-        mode="number",
-        value=producto_mas_vendido_unidades['Unidades Vendidas'],
-        title={"text": f"Producto Más Vendido<br><span style='font-size:0.8em;color:gray'>({producto_mas_vendido_unidades['Producto']})</span>"},
-        domain={'x': [0, 0.25], 'y': [0.5, 1]}
-    ))
-
-    fig.add_trace(go.Indicator(
-        mode="number",
-        value=producto_menos_vendido_unidades['Unidades Vendidas'],
-        title={"text": f"Producto Menos Vendido<br><span style='font-size:0.8em;color:gray'>({producto_menos_vendido_unidades['Producto']})</span>"},
-        domain={'x': [0.35, 0.60], 'y': [0.5, 1]}
-    ))
-
-    fig.add_trace(go.Indicator(
-        mode="number",
-        value=producto_mas_ingresos['Ingresos'],
-        title={"text": f"Producto con Más Ingresos<br><span style='font-size:0.8em;color:gray'>({producto_mas_ingresos['Producto']})</span>"},
-         number={'prefix': "$", 'valueformat': '.,0f'},
-        domain={'x': [0, 0.25], 'y': [0, 0.45]}
-    ))
-
-    fig.add_trace(go.Indicator(
-        mode="number",
-        value=producto_menos_ingresos['Ingresos'],
-        title={"text": f"Producto con Menos Ingresos<br><span style='font-size:0.8em;color:gray'>({producto_menos_ingresos['Producto']})</span>"},
-         number={'prefix': "$", 'valueformat': '.,0f'},
-        domain={'x': [0.35, 0.60], 'y': [0, 0.45]}
-    ))
-
-    fig.update_layout(
-        grid = {'rows': 2, 'columns': 2, 'pattern': "independent"},
-        title="Indicadores Clave de Ventas por Producto"
-    )
-
-    return fig
-
-@app.callback(
-    Output('seller-performance-card', 'children'),
-    Input('seller-dropdown', 'value')
-)
-def update_seller_performance_card(selected_seller):
-    if not selected_seller:
-        return html.Div("Seleccione un vendedor para ver su rendimiento.", className="text-center")
-
-    # Filter data for the selected seller
-    data_vendedor = data[data['Vendedor'] == selected_seller]
-
-    if data_vendedor.empty:
-        return html.Div(f"No hay datos disponibles para el vendedor {selected_seller}", className="text-center")
-
-    # Calculate total revenue for the selected seller
-    ingresos_totales_vendedor = data_vendedor['Ingresos'].sum()
-
-    # Calculate the mean income across all sellers for the delta reference
-    mean_ingresos_all_sellers = data.groupby('Vendedor')['Ingresos'].sum().mean()
-
-    # Calculate the revenue per product for this seller
-    ingresos_productos_vendedor = data_vendedor.groupby('Producto')['Ingresos'].sum().reset_index()
-    ingresos_productos_vendedor = ingresos_productos_vendedor.sort_values(by='Ingresos', ascending=False)
+def build_seller_card_figure(selected_seller):
+    # Look up the precomputed totals for the selected seller
+    ingresos_totales_vendedor = SELLER_TOTAL[selected_seller]
+    ingresos_productos_vendedor = SELLER_PRODUCT_REV[selected_seller]
 
     # Create the figure for the seller card
     fig = go.Figure(go.Indicator(
         mode = "number+delta",
         value = ingresos_totales_vendedor,
         number = {'prefix': "$", 'valueformat': '.,0f'},
-        delta = {'reference': mean_ingresos_all_sellers, 'relative': True, 'valueformat': '.1%'},
+        delta = {'reference': MEAN_INGRESOS_PER_SELLER, 'relative': True, 'valueformat': '.1%'},
         title = {"text": f"Ingresos Totales: {selected_seller}"},
         domain = {'x': [0, 1], 'y': [0.6, 1]}
     ))
@@ -278,7 +334,7 @@ def update_seller_performance_card(selected_seller):
                     fill_color='paleturquoise',
                     align='left'),
         cells=dict(values=[ingresos_productos_vendedor['Producto'],
-                           ingresos_productos_vendedor['Ingresos'].apply(lambda x: f"${x:,.0f}")],
+                           ingresos_productos_vendedor['Ingresos_Texto']],
                    fill_color='lavender',
                    align='left'),
         domain = {'x': [0, 1], 'y': [0, 0.5]}
@@ -289,7 +345,26 @@ def update_seller_performance_card(selected_seller):
         height=400
     )
 
-    return dcc.Graph(figure=fig)
+    return fig
+
+# The data never changes, so each seller's card only has to be built once
+@cache.memoize(timeout=3600, make_name=lambda fname: f'{fname}-{data_version}')
+def get_seller_card_figure(selected_seller):
+    return figure_to_json(build_seller_card_figure(selected_seller))
+
+@app.callback(
+    Output('seller-performance-card', 'children'),
+    Input('seller-dropdown', 'value')
+)
+def update_seller_performance_card(selected_seller):
+    if not selected_seller:
+        return html.Div("Seleccione un vendedor para ver su rendimiento.", className="text-center")
+
+    # Checked before the memoized call so arbitrary values are never cached
+    if selected_seller not in SELLER_PRODUCT_REV:
+        return html.Div(f"No hay datos disponibles para el vendedor {selected_seller}", className="text-center")
+
+    return dcc.Graph(figure=get_seller_card_figure(selected_seller))
 
 if __name__ == '__main__':
     app.run_server(debug=True, mode='external') # Use mode='external' for Colab environment